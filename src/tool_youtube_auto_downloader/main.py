@@ -6,12 +6,21 @@ Processes multiple YouTube URLs from a file using configuration.
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import yaml
 
 from tool_youtube_auto_downloader.pull_yt import DownloadTracker, YouTubePuller
 
+try:
+    # libyaml bindings, much faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+URL_PREFIXES = ("http://", "https://")
+
 
 def load_config(config_path: Path) -> dict:
     """Load configuration from YAML file."""
@@ -20,9 +29,8 @@ def load_config(config_path: Path) -> dict:
         sys.exit(1)
 
     try:
-        with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-            return config or {}
+        config = yaml.load(config_path.read_bytes(), Loader=SafeLoader)
+        return config or {}
     except yaml.YAMLError as e:
         print(f"Error: Invalid YAML configuration: {e}", file=sys.stderr)
         sys.exit(1)
@@ -37,24 +45,24 @@ def read_urls_file(urls_file: Path) -> list[str]:
         print(f"Error: URLs file not found: {urls_file}", file=sys.stderr)
         sys.exit(1)
 
-    urls = []
     try:
-        with open(urls_file, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                # Basic validation
-                if not (line.startswith("http://") or line.startswith("https://")):
-                    print(f"Warning: Line {line_num} does not look like a URL: {line}", file=sys.stderr)
-                    continue
-                urls.append(line)
-        return urls
+        lines = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines()]
     except OSError as e:
         print(f"Error: Could not read URLs file: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Skip empty lines and comments
+    entries = [line for line in lines if line and not line.startswith("#")]
+    # Basic validation
+    urls = [line for line in entries if line.startswith(URL_PREFIXES)]
+
+    if len(urls) != len(entries):
+        # Second pass only when something was rejected, to report line numbers
+        for line_num, line in enumerate(lines, 1):
+            if line and not line.startswith("#") and not line.startswith(URL_PREFIXES):
+                print(f"Warning: Line {line_num} does not look like a URL: {line}", file=sys.stderr)
+    return urls
+
 
 def validate_config(config: dict) -> None:
     """Validate that required configuration keys are present."""
@@ -79,9 +87,29 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable automatic file organization (store all files in root directory)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Maximum number of videos downloaded at the same time, across all URLs (default: 4)",
+    )
+    parser.add_argument(
+        "--throttle",
+        action="store_true",
+        help="Sleep between requests and downloads to reduce the risk of rate limiting",
+    )
     return parser.parse_args()
 
 
+def process_url(puller: YouTubePuller, url: str, index: int, total: int) -> None:
+    """Pull a single URL (runs in a worker thread)."""
+    print("\n" + "=" * 70)
+    print(f"Processing URL {index}/{total}")
+    print("=" * 70)
+    if not puller.pull(url):
+        raise RuntimeError("Could not extract information from URL")
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -109,30 +137,37 @@ def main():
 
     # Initialize tracker and puller
     tracker = DownloadTracker(history_file)
-    puller = YouTubePuller(output_dir, tracker, flat_import=args.flat_import)
-
-    # Process each URL
-    for i, url in enumerate(urls, 1):
-        print("\n" + "=" * 70)
-        print(f"Processing URL {i}/{len(urls)}")
-        print("=" * 70)
-
-        try:
-            puller.pull(url)
-        except KeyboardInterrupt:
-            print("\n\nInterrupted by user")
-            sys.exit(1)
-        except Exception as e:
-            # Handle encoding errors for error messages
+    puller = YouTubePuller(output_dir, tracker, flat_import=args.flat_import, jobs=args.jobs, throttle=args.throttle)
+
+    # Process URLs in parallel, up to args.jobs at a time
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    futures = {executor.submit(process_url, puller, url, i, len(urls)): url for i, url in enumerate(urls, 1)}
+    try:
+        for future in as_completed(futures):
+            url = futures[future]
             try:
-                error_msg = str(e)
-                print(f"\nError processing {url}: {error_msg}", file=sys.stderr)
-            except UnicodeEncodeError:
-                # Fallback for Windows console encoding issues
-                error_msg = str(e).encode("ascii", "replace").decode("ascii")
-                print(f"\nError processing {url}: {error_msg}", file=sys.stderr)
-            print("Continuing to next URL...\n")
-            continue
+                future.result()
+            except Exception as e:
+                # Handle encoding errors for error messages
+                try:
+                    error_msg = str(e)
+                    print(f"\nError processing {url}: {error_msg}", file=sys.stderr)
+                except UnicodeEncodeError:
+                    # Fallback for Windows console encoding issues
+                    error_msg = str(e).encode("ascii", "replace").decode("ascii")
+                    print(f"\nError processing {url}: {error_msg}", file=sys.stderr)
+                print("Continuing with remaining URLs...\n")
+    except KeyboardInterrupt:
+        print("\n\nInterrupted by user, waiting for running downloads to finish")
+        # Ctrl-C only reaches this thread: stop the playlists being processed by the workers as well
+        puller.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        sys.exit(1)
+    finally:
+        # Let running downloads finish, release yt-dlp sessions, then flush and compact the history file
+        executor.shutdown()
+        puller.close()
+        tracker.close()
 
     # Final summary
     print("\n" + "=" * 70)